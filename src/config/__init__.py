@@ -8,99 +8,147 @@ This module initializes Dynaconf with support for multiple configuration sources
 - User preferences
 """
 
-from dynaconf import Dynaconf, Validator
 from pathlib import Path
 import os
 
 # Get the config directory path
-CONFIG_DIR = Path(__file__).parent
+_CONFIG_DIR_STR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_DIR = Path(_CONFIG_DIR_STR)
 ROOT_DIR = CONFIG_DIR.parent.parent
 
-# Initialize Dynaconf
-settings = Dynaconf(
-    # Configuration files to load (in order of precedence)
-    settings_files=[
-        str(CONFIG_DIR / "settings.toml"),
-        str(CONFIG_DIR / "config.yaml"),
-        str(CONFIG_DIR / "local_settings.toml"),  # Local overrides (gitignored)
-    ],
-    
-    # Environment variables prefix
-    envvar_prefix="CLOUDCRAVER",
-    
-    # Support for environments (development, production, etc.) - start with False for simplicity
-    environments=False,
-    
-    # Load from environment variables
-    load_dotenv=True,
-    
-    # Merge configs from multiple sources
-    merge_enabled=True,
-    
-    # Validate configuration on load - start with False for initial setup
-    validate=False,
-    
-    # Case-insensitive configuration keys
-    lowercase_read=True,
-    
-    # Additional directories to search for config files
-    root_path=ROOT_DIR,
-    
-    # Support for .secrets files
-    secrets=".secrets.toml",
+# Cloud providers accepted for cloud.default_provider
+_VALID_PROVIDERS = frozenset(("aws", "azure", "gcp"))
+
+# The Dynaconf instance is built on first access to ``config``/``settings``
+# so that CLI paths which never read configuration skip the import cost.
+_settings = None
+
+
+# Configuration files to load (in order of precedence)
+_SETTINGS_FILE_CANDIDATES = (
+    os.path.join(_CONFIG_DIR_STR, "settings.toml"),
+    os.path.join(_CONFIG_DIR_STR, "config.yaml"),
+    os.path.join(_CONFIG_DIR_STR, "local_settings.toml"),  # Local overrides (gitignored)
+)
+
+
+def _existing_settings_files():
+    """
+    Return the configuration files that currently exist.
     
-    # Include base configuration
-    includes=["base_config.toml"],
+    Absent files are dropped so Dynaconf never imports their loader. The
+    check is repeated on every reload to pick up files created since.
+    """
+    return [path for path in _SETTINGS_FILE_CANDIDATES if os.path.exists(path)]
+
+
+def _build_settings():
+    """Construct the Dynaconf settings instance."""
+    from dynaconf import Dynaconf, Validator
     
-    # Basic validators - start simple and add more as needed
-    validators=[
-        # Essential application settings
-        Validator("app.name", must_exist=True, is_type_of=str),
-        Validator("app.version", must_exist=True, is_type_of=str),
+    return Dynaconf(
+        settings_files=_existing_settings_files(),
         
-        # Cloud provider validation
-        Validator("cloud.default_provider", must_exist=True, condition=lambda x: x in ["aws", "azure", "gcp"]),
-    ]
-)
+        # Environment variables prefix
+        envvar_prefix="CLOUDCRAVER",
+        
+        # Support for environments (development, production, etc.) - start with False for simplicity
+        environments=False,
+        
+        # Load from environment variables
+        load_dotenv=True,
+        
+        # Merge configs from multiple sources
+        merge_enabled=True,
+        
+        # Validate configuration on load - start with False for initial setup
+        validate=False,
+        
+        # Case-insensitive configuration keys
+        lowercase_read=True,
+        
+        # Additional directories to search for config files
+        root_path=ROOT_DIR,
+        
+        # Support for .secrets files
+        secrets=".secrets.toml",
+        
+        # Include base configuration
+        includes=["base_config.toml"],
+        
+        # Basic validators - start simple and add more as needed
+        validators=[
+            # Essential application settings
+            Validator("app.name", must_exist=True, is_type_of=str),
+            Validator("app.version", must_exist=True, is_type_of=str),
+            
+            # Cloud provider validation
+            Validator("cloud.default_provider", must_exist=True, condition=_VALID_PROVIDERS.__contains__),
+        ]
+    )
+
+
+def _get_settings():
+    """Return the settings instance, building it on first call."""
+    global _settings
+    if _settings is None:
+        _settings = _build_settings()
+        # Export the main configuration instance as plain module attributes
+        # so later lookups no longer go through __getattr__.
+        globals()["settings"] = globals()["config"] = _settings
+    return _settings
 
-# Export the main configuration instance
-config = settings
+
+def __getattr__(name):
+    """Lazily resolve ``config`` and ``settings`` (PEP 562)."""
+    if name in ("config", "settings"):
+        return _get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Convenience functions for accessing nested configurations
 def get_cloud_config():
     """Get cloud provider configuration."""
-    return config.cloud
+    return _get_settings().cloud
 
 def get_user_preferences():
     """Get user preferences configuration."""
-    return config.user.preferences
+    return _get_settings().user.preferences
 
 def get_app_config():
     """Get application configuration."""
-    return config.app
+    return _get_settings().app
 
 def get_validation_config():
     """Get validation configuration."""
-    return config.validation
+    return _get_settings().validation
 
 def get_terraform_config():
     """Get Terraform-specific configuration."""
-    return config.terraform
+    return _get_settings().terraform
 
 # Configuration file discovery and precedence
+_CONFIG_SOURCES = (
+    "CLI arguments",
+    "Environment variables",
+    "local_settings.toml",
+    "settings.toml", 
+    "config.yaml",
+    "base_config.toml"
+)
+
 def get_config_sources():
     """Return the configuration sources in order of precedence (highest to lowest)."""
-    return [
-        "CLI arguments",
-        "Environment variables",
-        "local_settings.toml",
-        "settings.toml", 
-        "config.yaml",
-        "base_config.toml"
-    ]
+    return _CONFIG_SOURCES
 
 def reload_config():
     """Reload configuration from all sources."""
+    settings = _get_settings()
+    # Files may have been created or removed since the last load. Dynaconf
+    # keeps the list in both keys, and merge_enabled would otherwise append
+    # to the old list instead of replacing it.
+    settings_files = _existing_settings_files()
+    for key in ("SETTINGS_FILE_FOR_DYNACONF", "SETTINGS_MODULE"):
+        settings.set(key, settings_files, merge=False)
     settings.reload()
 
 # Export all public functions and the main config
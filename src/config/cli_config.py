@@ -6,20 +6,114 @@ integrating them with the Dynaconf configuration system.
 """
 
 import argparse
+import functools
+import logging
+import os
+import shutil
+import stat
 import sys
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
-from . import config
+
+logger = logging.getLogger(__name__)
+
+# Allowed values for options with a fixed set of choices
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_OUTPUT_FORMATS = ("rich", "json", "text")
+_PROVIDER_CHOICES = ("aws", "azure", "gcp")
+_THEMES = ("auto", "light", "dark")
+_STATE_BACKENDS = ("local", "s3", "azurerm", "gcs")
+
+# (argument name, configuration key, value) for flag-driven overrides.
+# A value of None means the argument's own value is used.
+_OVERRIDE_MAP = (
+    # App configuration overrides
+    ("debug", "app.debug", True),
+    ("log_level", "app.log_level", None),
+    ("output_format", "app.output_format", None),
+    
+    # Cloud configuration overrides
+    ("provider", "cloud.default_provider", None),
+    
+    # User preferences overrides
+    ("theme", "user.preferences.theme", None),
+    ("editor", "user.preferences.editor", None),
+    
+    # Validation overrides
+    ("strict", "validation.strict_mode", True),
+    ("fail_on_warnings", "validation.fail_on_warnings", True),
+    
+    # Terraform overrides
+    ("terraform_version", "terraform.version", None),
+    ("state_backend", "terraform.state_backend", None),
+    
+    # Path overrides
+    ("output_dir", "paths.output_dir", None),
+    ("templates_dir", "paths.templates_dir", None),
+    ("cache_dir", "paths.cache_dir", None),
+    
+    # CLI overrides
+    ("no_progress", "cli.show_progress", False),
+    ("no_color", "cli.colored_output", False),
+    ("batch", "cli.interactive_mode", False),
+    ("yes", "cli.confirm_actions", False),
+)
+
+# Command lines answered straight from the cached help text
+_HELP_ARGV = (["-h"], ["--help"])
+
+# (argument name, configuration key) for on/off options; these default to
+# None so that an explicit off is distinguishable from not given
+_TOGGLE_MAP = (
+    ("auto_save", "user.preferences.auto_save"),
+    ("security_scan", "terraform.validation.enable_security_scan"),
+    ("auto_init", "terraform.auto_init"),
+)
+
+# Configuration key that --profile maps to for each provider
+_PROFILE_KEYS = {
+    "aws": "cloud.aws.profile",
+    "azure": "cloud.azure.subscription_id",
+    "gcp": "cloud.gcp.project_id",
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _stat(path: str) -> Optional[os.stat_result]:
+    """Stat a path named on the command line, or return None if it is missing.
+    
+    Cached so validation and loading share one syscall per path; the cache
+    is cleared whenever a new command line is parsed.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
 class CLIConfigManager:
     """Manages CLI arguments and their integration with configuration."""
     
+    __slots__ = ("args", "_overrides_cache")
+    
+    # Parser and rendered help shared by all instances; parsing keeps no
+    # state on the parser
+    _shared_parser = None
+    _help_text = None
+    
     def __init__(self):
         """Initialize CLI config manager."""
-        self.parser = self._create_parser()
         self.args = None
+        self._overrides_cache = None
+    
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Argument parser, built once per class on first use."""
+        cls = type(self)
+        if cls.__dict__.get("_shared_parser") is None:
+            cls._shared_parser = self._create_parser()
+        return cls._shared_parser
     
     def _create_parser(self) -> argparse.ArgumentParser:
         """Create the argument parser with all configuration options."""
@@ -35,7 +129,19 @@ Examples:
             """
         )
         
-        # Global configuration options
+        self._add_global_args(parser)
+        self._add_cloud_args(parser)
+        self._add_preference_args(parser)
+        self._add_validation_args(parser)
+        self._add_terraform_args(parser)
+        self._add_path_args(parser)
+        self._add_cli_args(parser)
+        self._add_environment_args(parser)
+        
+        return parser
+    
+    def _add_global_args(self, parser: argparse.ArgumentParser) -> None:
+        """Add global configuration options."""
         parser.add_argument(
             "--config-file", 
             type=str,
@@ -56,20 +162,21 @@ Examples:
         
         parser.add_argument(
             "--log-level",
-            choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+            choices=_LOG_LEVELS,
             help="Set logging level"
         )
         
         parser.add_argument(
             "--output-format",
-            choices=["rich", "json", "text"],
+            choices=_OUTPUT_FORMATS,
             help="Set output format"
         )
-        
-        # Cloud provider options
+    
+    def _add_cloud_args(self, parser: argparse.ArgumentParser) -> None:
+        """Add cloud provider options."""
         parser.add_argument(
             "--provider",
-            choices=["aws", "azure", "gcp"],
+            choices=_PROVIDER_CHOICES,
             help="Cloud provider to use"
         )
         
@@ -84,23 +191,19 @@ Examples:
             type=str,
             help="Cloud provider profile/subscription"
         )
-        
-        # User preference options
+    
+    def _add_preference_args(self, parser: argparse.ArgumentParser) -> None:
+        """Add user preference options."""
         parser.add_argument(
             "--auto-save",
-            action="store_true",
-            help="Enable auto-save for user preferences"
-        )
-        
-        parser.add_argument(
-            "--no-auto-save",
-            action="store_true", 
-            help="Disable auto-save for user preferences"
+            action=argparse.BooleanOptionalAction,
+            default=None,
+            help="Enable or disable auto-save for user preferences"
         )
         
         parser.add_argument(
             "--theme",
-            choices=["auto", "light", "dark"],
+            choices=_THEMES,
             help="UI theme"
         )
         
@@ -109,8 +212,9 @@ Examples:
             type=str,
             help="Default editor for configuration files"
         )
-        
-        # Validation options
+    
+    def _add_validation_args(self, parser: argparse.ArgumentParser) -> None:
+        """Add validation options."""
         parser.add_argument(
             "--strict",
             action="store_true",
@@ -125,17 +229,22 @@ Examples:
         
         parser.add_argument(
             "--enable-security-scan",
-            action="store_true",
+            action="store_const",
+            const=True,
+            dest="security_scan",
             help="Enable security scanning"
         )
         
         parser.add_argument(
             "--disable-security-scan",
-            action="store_true",
+            action="store_const",
+            const=False,
+            dest="security_scan",
             help="Disable security scanning"
         )
-        
-        # Terraform options
+    
+    def _add_terraform_args(self, parser: argparse.ArgumentParser) -> None:
+        """Add Terraform options."""
         parser.add_argument(
             "--terraform-version",
             type=str,
@@ -144,23 +253,19 @@ Examples:
         
         parser.add_argument(
             "--auto-init",
-            action="store_true",
-            help="Enable Terraform auto-init"
-        )
-        
-        parser.add_argument(
-            "--no-auto-init",
-            action="store_true",
-            help="Disable Terraform auto-init"
+            action=argparse.BooleanOptionalAction,
+            default=None,
+            help="Enable or disable Terraform auto-init"
         )
         
         parser.add_argument(
             "--state-backend",
-            choices=["local", "s3", "azurerm", "gcs"],
+            choices=_STATE_BACKENDS,
             help="Terraform state backend"
         )
-        
-        # Path options
+    
+    def _add_path_args(self, parser: argparse.ArgumentParser) -> None:
+        """Add path options."""
         parser.add_argument(
             "--output-dir",
             type=str,
@@ -178,8 +283,9 @@ Examples:
             type=str,
             help="Cache directory"
         )
-        
-        # CLI options
+    
+    def _add_cli_args(self, parser: argparse.ArgumentParser) -> None:
+        """Add CLI options."""
         parser.add_argument(
             "--no-progress",
             action="store_true",
@@ -203,15 +309,14 @@ Examples:
             action="store_true",
             help="Automatically answer yes to prompts"
         )
-        
-        # Environment selection
+    
+    def _add_environment_args(self, parser: argparse.ArgumentParser) -> None:
+        """Add environment selection options."""
         parser.add_argument(
             "--env",
             type=str,
             help="Environment to use (development, production, etc.)"
         )
-        
-        return parser
     
     def parse_args(self, args: Optional[List[str]] = None) -> argparse.Namespace:
         """
@@ -223,6 +328,8 @@ Examples:
         Returns:
             Parsed arguments namespace
         """
+        # Paths named by a new command line must be looked at afresh
+        _stat.cache_clear()
         self.args = self.parser.parse_args(args)
         return self.args
     
@@ -236,113 +343,76 @@ Examples:
         if self.args is None:
             return {}
         
-        overrides = {}
+        if self._overrides_cache is not None and self._overrides_cache[0] is self.args:
+            return dict(self._overrides_cache[1])
+        
+        args = self.args
         
-        # App configuration overrides
-        if self.args.debug:
-            overrides["app.debug"] = True
-        if self.args.log_level:
-            overrides["app.log_level"] = self.args.log_level
-        if self.args.output_format:
-            overrides["app.output_format"] = self.args.output_format
+        # Flag-driven overrides
+        overrides = {
+            config_key: arg_value if value is None else value
+            for arg_name, config_key, value in _OVERRIDE_MAP
+            if (arg_value := getattr(args, arg_name))
+        }
         
-        # Cloud configuration overrides
-        if self.args.provider:
-            overrides["cloud.default_provider"] = self.args.provider
+        # On/off options, applied whenever given in either direction
+        overrides.update(
+            (config_key, arg_value)
+            for arg_name, config_key in _TOGGLE_MAP
+            if (arg_value := getattr(args, arg_name)) is not None
+        )
+        
+        # Provider-dependent cloud overrides
+        provider = self.args.provider or "aws"
         if self.args.region:
-            overrides["cloud.default_regions." + (self.args.provider or "aws")] = self.args.region
-        if self.args.profile:
-            provider = self.args.provider or "aws"
-            if provider == "aws":
-                overrides["cloud.aws.profile"] = self.args.profile
-            elif provider == "azure":
-                overrides["cloud.azure.subscription_id"] = self.args.profile
-            elif provider == "gcp":
-                overrides["cloud.gcp.project_id"] = self.args.profile
-        
-        # User preferences overrides
-        if self.args.auto_save:
-            overrides["user.preferences.auto_save"] = True
-        if self.args.no_auto_save:
-            overrides["user.preferences.auto_save"] = False
-        if self.args.theme:
-            overrides["user.preferences.theme"] = self.args.theme
-        if self.args.editor:
-            overrides["user.preferences.editor"] = self.args.editor
-        
-        # Validation overrides
-        if self.args.strict:
-            overrides["validation.strict_mode"] = True
-        if self.args.fail_on_warnings:
-            overrides["validation.fail_on_warnings"] = True
-        if self.args.enable_security_scan:
-            overrides["terraform.validation.enable_security_scan"] = True
-        if self.args.disable_security_scan:
-            overrides["terraform.validation.enable_security_scan"] = False
-        
-        # Terraform overrides
-        if self.args.terraform_version:
-            overrides["terraform.version"] = self.args.terraform_version
-        if self.args.auto_init:
-            overrides["terraform.auto_init"] = True
-        if self.args.no_auto_init:
-            overrides["terraform.auto_init"] = False
-        if self.args.state_backend:
-            overrides["terraform.state_backend"] = self.args.state_backend
-        
-        # Path overrides
-        if self.args.output_dir:
-            overrides["paths.output_dir"] = self.args.output_dir
-        if self.args.templates_dir:
-            overrides["paths.templates_dir"] = self.args.templates_dir
-        if self.args.cache_dir:
-            overrides["paths.cache_dir"] = self.args.cache_dir
-        
-        # CLI overrides
-        if self.args.no_progress:
-            overrides["cli.show_progress"] = False
-        if self.args.no_color:
-            overrides["cli.colored_output"] = False
-        if self.args.batch:
-            overrides["cli.interactive_mode"] = False
-        if self.args.yes:
-            overrides["cli.confirm_actions"] = False
-        
-        return overrides
+            overrides["cloud.default_regions." + provider] = self.args.region
+        if self.args.profile and provider in _PROFILE_KEYS:
+            overrides[_PROFILE_KEYS[provider]] = self.args.profile
+        
+        self._overrides_cache = (self.args, overrides)
+        return dict(overrides)
     
     def apply_cli_overrides(self):
         """Apply CLI argument overrides to the configuration."""
+        from . import config
+        
         overrides = self.get_config_overrides()
         
-        # Apply environment if specified
-        if self.args and self.args.env:
-            config.settings.setenv(self.args.env)
+        # Apply environment if specified; switching reloads every source,
+        # so skip it when the requested environment is already active
+        if self.args and self.args.env and self.args.env != config.current_env:
+            config.setenv(self.args.env)
         
-        # Apply each override
-        for key, value in overrides.items():
-            config.settings.set(key, value)
+        # Apply all overrides in a single merge pass
+        if overrides:
+            config.update(overrides, merge=True)
     
     def load_custom_config_file(self):
         """Load custom configuration file if specified."""
+        from . import config
+        
         if self.args and self.args.config_file:
             config_path = Path(self.args.config_file)
-            if config_path.exists():
+            if _stat(self.args.config_file) is not None:
                 # Add the custom config file to settings
-                config.settings.load_file(path=str(config_path))
+                config.load_file(path=str(config_path))
             else:
-                print(f"Warning: Configuration file not found: {config_path}")
+                logger.warning("Configuration file not found: %s", config_path)
         
         if self.args and self.args.config_dir:
             config_dir = Path(self.args.config_dir)
-            if config_dir.exists():
+            if _stat(self.args.config_dir) is not None:
                 # Update the search paths
-                config.settings.configure(root_path=str(config_dir))
+                config.configure(root_path=str(config_dir))
             else:
-                print(f"Warning: Configuration directory not found: {config_dir}")
+                logger.warning("Configuration directory not found: %s", config_dir)
     
     def get_help(self) -> str:
-        """Get help text for CLI configuration."""
-        return self.parser.format_help()
+        """Get help text for CLI configuration, formatted once per class."""
+        cls = type(self)
+        if cls.__dict__.get("_help_text") is None:
+            cls._help_text = self.parser.format_help()
+        return cls._help_text
     
     def validate_args(self) -> List[str]:
         """
@@ -356,23 +426,12 @@ Examples:
         
         errors = []
         
-        # Check for conflicting auto-save options
-        if self.args.auto_save and self.args.no_auto_save:
-            errors.append("Cannot specify both --auto-save and --no-auto-save")
-        
-        # Check for conflicting auto-init options
-        if self.args.auto_init and self.args.no_auto_init:
-            errors.append("Cannot specify both --auto-init and --no-auto-init")
-        
-        # Check for conflicting security scan options
-        if self.args.enable_security_scan and self.args.disable_security_scan:
-            errors.append("Cannot specify both --enable-security-scan and --disable-security-scan")
-        
         # Validate paths exist if specified
-        if self.args.config_file and not Path(self.args.config_file).exists():
+        if self.args.config_file and _stat(self.args.config_file) is None:
             errors.append(f"Configuration file does not exist: {self.args.config_file}")
         
-        if self.args.config_dir and not Path(self.args.config_dir).is_dir():
+        config_dir_stat = _stat(self.args.config_dir) if self.args.config_dir else None
+        if self.args.config_dir and (config_dir_stat is None or not stat.S_ISDIR(config_dir_stat.st_mode)):
             errors.append(f"Configuration directory does not exist: {self.args.config_dir}")
         
         return errors
@@ -390,9 +449,81 @@ def get_cli_manager() -> CLIConfigManager:
     return _cli_manager
 
 
+def _help_cache_file() -> Path:
+    """Location of the help text rendered by a previous run."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "cloudcraver" / "help.txt"
+
+
+# Environment variables gettext consults when translating argparse's text
+_LOCALE_ENV_VARS = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+
+def _cached_help_text(manager: CLIConfigManager) -> str:
+    """
+    Get help text, reusing the copy rendered by a previous run when valid.
+    
+    The cache is keyed on this module's mtime, the terminal width, the
+    Python version and the locale, which together determine argparse's
+    output. Help is rendered without colour so the cached copy is safe to
+    print to both terminals and pipes.
+    
+    Args:
+        manager: CLI manager used to render the help on a cache miss
+        
+    Returns:
+        Help text for the CLI
+    """
+    cache_key = "{}:{}:{}.{}:{}".format(
+        os.stat(__file__).st_mtime_ns,
+        shutil.get_terminal_size().columns,
+        *sys.version_info[:2],
+        ",".join(os.environ.get(name, "") for name in _LOCALE_ENV_VARS)
+    )
+    cache_file = _help_cache_file()
+    
+    try:
+        header, _, help_text = cache_file.read_text(encoding="utf-8").partition("\n")
+        if header == cache_key:
+            return help_text
+    except OSError:
+        pass
+    
+    # Python 3.14+ colours help when writing to a terminal
+    parser = manager.parser
+    color = getattr(parser, "color", False)
+    parser.color = False
+    try:
+        help_text = parser.format_help()
+    finally:
+        parser.color = color
+    
+    # Write to a temporary file and rename it so concurrent runs never
+    # read a partially written cache
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_text(f"{cache_key}\n{help_text}", encoding="utf-8")
+        os.replace(temp_file, cache_file)
+    except OSError:
+        # A read-only home directory just means no cache
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+    return help_text
+
+
 def parse_cli_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse CLI arguments and apply them to configuration."""
     manager = get_cli_manager()
+    
+    # Serve plain help requests without parsing, validating or touching config
+    argv = sys.argv[1:] if args is None else args
+    if argv in _HELP_ARGV:
+        sys.stdout.write(_cached_help_text(manager))
+        sys.exit(0)
+    
     parsed_args = manager.parse_args(args)
     
     # Validate arguments
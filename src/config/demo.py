@@ -10,6 +10,18 @@ import sys
 import os
 from pathlib import Path
 
+# Configuration instance, resolved once by _cfg()
+_CONFIG = None
+
+
+def _cfg():
+    """Return the configuration instance, importing it on first use."""
+    global _CONFIG
+    if _CONFIG is None:
+        from config import config
+        _CONFIG = config
+    return _CONFIG
+
 def test_imports():
     """Test if all required modules can be imported."""
     print("🔍 Testing imports...")
@@ -25,7 +37,7 @@ def test_imports():
     try:
         # Add the src directory to the path for imports
         sys.path.insert(0, str(Path(__file__).parent.parent))
-        from config import config
+        _cfg()
         print("✅ Config module import successful")
     except ImportError as e:
         print(f"❌ Config module import failed: {e}")
@@ -40,7 +52,7 @@ def demo_basic_configuration():
     print("BASIC CONFIGURATION ACCESS")
     print("=" * 60)
     
-    from config import config, get_cloud_config, get_user_preferences, get_app_config
+    from config import get_cloud_config, get_user_preferences, get_app_config
     
     # Access configuration sections
     print("📋 Application Configuration:")
@@ -95,7 +107,7 @@ def demo_simple_config_access():
     print("=" * 60)
     
     try:
-        from config import config
+        config = _cfg()
         print("✅ Configuration loaded successfully!")
         
         # Try to access basic configuration
@@ -108,7 +120,7 @@ def demo_simple_config_access():
             print(f"☁️  Available Providers: {config.cloud.providers}")
         
         print("\n🔧 Configuration keys available:")
-        keys = list(config.keys())
+        keys = tuple(config.keys())
         for key in keys[:10]:  # Show first 10 keys
             print(f"  • {key}")
         
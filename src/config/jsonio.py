@@ -0,0 +1,23 @@
+"""
+JSON helpers shared by the configuration modules.
+
+orjson parses and serializes in C; the standard library is the fallback when
+it isn't installed. Both loaders accept bytes as well as str.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj as indented, UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
@@ -5,10 +5,28 @@ This module defines the schema for validating configuration files
 and provides type-safe access to configuration values.
 """
 
-from typing import List, Dict, Optional, Union, Literal
-from pydantic import BaseModel, Field, validator, root_validator
+from functools import lru_cache
+from typing import Annotated, List, Dict, Optional, Union, Literal
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator, model_validator
 from pathlib import Path
 import os
+import re
+
+
+# Shared literal types, referenced by every field that accepts these values
+ProviderLiteral = Literal["aws", "azure", "gcp"]
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+OutputFormat = Literal["rich", "json", "text"]
+ReportFormat = Literal["json", "html", "text"]
+Theme = Literal["auto", "light", "dark"]
+StateBackend = Literal["local", "s3", "azurerm", "gcs"]
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a regular expression once per distinct pattern."""
+    return re.compile(pattern)
 
 
 class AppConfig(BaseModel):
@@ -17,8 +35,8 @@ class AppConfig(BaseModel):
     version: str = Field(..., description="Application version")
     description: Optional[str] = Field(None, description="Application description")
     debug: bool = Field(False, description="Enable debug mode")
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field("INFO")
-    output_format: Literal["rich", "json", "text"] = Field("rich")
+    log_level: LogLevel = Field("INFO")
+    output_format: OutputFormat = Field("rich")
 
 
 class CloudRegionsConfig(BaseModel):
@@ -51,39 +69,37 @@ class GCPConfig(BaseModel):
 
 class CloudConfig(BaseModel):
     """Cloud provider configuration schema."""
-    default_provider: Literal["aws", "azure", "gcp"] = Field("aws")
-    providers: List[Literal["aws", "azure", "gcp"]] = Field(["aws"])
+    default_provider: ProviderLiteral = Field("aws")
+    providers: List[ProviderLiteral] = Field(["aws"])
     default_regions: CloudRegionsConfig = Field(default_factory=CloudRegionsConfig)
     aws: AWSConfig = Field(default_factory=AWSConfig)
     azure: AzureConfig = Field(default_factory=AzureConfig)
     gcp: GCPConfig = Field(default_factory=GCPConfig)
     
-    @validator('providers')
+    @field_validator('providers')
+    @classmethod
     def validate_providers(cls, v):
         """Ensure at least one provider is specified."""
         if not v:
             raise ValueError("At least one cloud provider must be specified")
         return v
     
-    @root_validator
-    def validate_default_provider_in_providers(cls, values):
+    @model_validator(mode='after')
+    def validate_default_provider_in_providers(self):
         """Ensure default provider is in the providers list."""
-        default_provider = values.get('default_provider')
-        providers = values.get('providers', [])
-        
-        if default_provider and default_provider not in providers:
-            raise ValueError(f"Default provider '{default_provider}' must be in providers list")
+        if self.default_provider not in self.providers:
+            raise ValueError(f"Default provider '{self.default_provider}' must be in providers list")
         
-        return values
+        return self
 
 
 class UserPreferencesConfig(BaseModel):
     """User preferences configuration schema."""
-    default_provider: Optional[Literal["aws", "azure", "gcp"]] = Field(None)
+    default_provider: Optional[ProviderLiteral] = Field(None)
     default_region: Optional[str] = Field(None)
     auto_save: bool = Field(True)
     confirm_destructive_actions: bool = Field(True)
-    theme: Literal["auto", "light", "dark"] = Field("auto")
+    theme: Theme = Field("auto")
     editor: str = Field("vim")
 
 
@@ -122,7 +138,7 @@ class TerraformConfig(BaseModel):
     auto_init: bool = Field(True)
     auto_plan: bool = Field(False)
     auto_apply: bool = Field(False)
-    state_backend: Literal["local", "s3", "azurerm", "gcs"] = Field("local")
+    state_backend: StateBackend = Field("local")
     validation: TerraformValidationConfig = Field(default_factory=TerraformValidationConfig)
     security: TerraformSecurityConfig = Field(default_factory=TerraformSecurityConfig)
 
@@ -132,6 +148,24 @@ class NamingConventionsConfig(BaseModel):
     enabled: bool = Field(True)
     resource_name_pattern: str = Field("^[a-z][a-z0-9-]*[a-z0-9]$")
     tag_requirements: List[str] = Field(["Environment", "Project", "Owner"])
+    
+    # Sections stay mutable, so re-check patterns assigned after validation
+    model_config = ConfigDict(validate_assignment=True)
+    
+    @field_validator('resource_name_pattern')
+    @classmethod
+    def validate_resource_name_pattern(cls, v):
+        """Ensure the pattern is a valid regular expression."""
+        try:
+            re.compile(v)
+        except re.error as e:
+            raise ValueError(f"Invalid resource name pattern: {e}")
+        return v
+    
+    @property
+    def resource_name_regex(self) -> "re.Pattern[str]":
+        """Compiled resource_name_pattern, built once per distinct pattern."""
+        return _compile_pattern(self.resource_name_pattern)
 
 
 class TaggingStandardsConfig(BaseModel):
@@ -146,24 +180,17 @@ class ValidationConfig(BaseModel):
     strict_mode: bool = Field(False)
     fail_on_warnings: bool = Field(False)
     generate_reports: bool = Field(True)
-    report_format: Literal["json", "html", "text"] = Field("json")
+    report_format: ReportFormat = Field("json")
     naming_conventions: NamingConventionsConfig = Field(default_factory=NamingConventionsConfig)
     tagging_standards: TaggingStandardsConfig = Field(default_factory=TaggingStandardsConfig)
 
 
 class PathsConfig(BaseModel):
     """Paths configuration schema."""
-    templates_dir: str = Field("templates")
-    output_dir: str = Field("output")
-    cache_dir: str = Field(".cache")
-    logs_dir: str = Field("logs")
-    
-    @validator('templates_dir', 'output_dir', 'cache_dir', 'logs_dir')
-    def validate_paths(cls, v):
-        """Ensure paths are valid."""
-        if not v:
-            raise ValueError("Path cannot be empty")
-        return v
+    templates_dir: NonEmptyStr = Field("templates")
+    output_dir: NonEmptyStr = Field("output")
+    cache_dir: NonEmptyStr = Field(".cache")
+    logs_dir: NonEmptyStr = Field("logs")
 
 
 class GenerationConfig(BaseModel):
@@ -195,11 +222,25 @@ class CloudCraverConfig(BaseModel):
     generation: GenerationConfig = Field(default_factory=GenerationConfig)
     cli: CLIConfig = Field(default_factory=CLIConfig)
     
-    class Config:
-        """Pydantic configuration."""
-        extra = "allow"  # Allow additional fields
-        validate_assignment = True  # Validate on assignment
-        use_enum_values = True  # Use enum values instead of enum objects
+    model_config = ConfigDict(
+        extra="allow",  # Allow additional fields
+        validate_assignment=True,  # Validate on assignment
+        use_enum_values=True,  # Use enum values instead of enum objects
+    )
+
+
+class CloudCraverConfigFrozen(CloudCraverConfig):
+    """
+    Configuration schema returned by the validation helpers.
+    
+    Only the top-level sections are frozen: reassigning ``config.app`` raises,
+    but the nested section models and their lists can still be modified.
+    """
+    
+    model_config = ConfigDict(
+        frozen=True,  # Config is built once and only read afterwards
+        validate_assignment=False,  # No assignments to validate
+    )
 
 
 def validate_config(config_dict: Dict) -> CloudCraverConfig:
@@ -210,28 +251,131 @@ def validate_config(config_dict: Dict) -> CloudCraverConfig:
         config_dict: Configuration dictionary to validate
         
     Returns:
-        Validated configuration object
+        Validated configuration object whose top-level sections cannot be
+        reassigned
+        
+    Raises:
+        ValidationError: If configuration is invalid
+    """
+    return CloudCraverConfigFrozen.model_validate(config_dict)
+
+
+def validate_config_json(data: Union[str, bytes]) -> CloudCraverConfig:
+    """
+    Validate a JSON document against schema.
+    
+    Parsing and validation happen in a single pass, which is faster than
+    calling validate_config() on the result of json.loads().
+    
+    Args:
+        data: JSON-encoded configuration
+        
+    Returns:
+        Validated configuration object whose top-level sections cannot be
+        reassigned
+        
+    Raises:
+        ValidationError: If configuration is invalid
+    """
+    return CloudCraverConfigFrozen.model_validate_json(data)
+
+
+def validate_config_trusted(config_dict: Dict) -> CloudCraverConfig:
+    """
+    Build a configuration object without running validation.
+    
+    Only use this for input that is already known to match the schema,
+    such as a dump of a previously validated config. Values are stored
+    as given: sections must already be model instances, and omitted
+    sections fall back to their defaults.
+    
+    Args:
+        config_dict: Schema-shaped configuration dictionary
+        
+    Returns:
+        Configuration object
+    """
+    return CloudCraverConfig.model_construct(**config_dict)
+
+
+def validate_paths_config(paths_dict: Dict) -> PathsConfig:
+    """
+    Validate only the ``paths`` section of a configuration.
+    
+    Args:
+        paths_dict: Paths configuration dictionary to validate
+        
+    Returns:
+        Validated paths configuration object
         
     Raises:
         ValidationError: If configuration is invalid
     """
-    return CloudCraverConfig(**config_dict)
+    return PathsConfig.model_validate(paths_dict)
+
+
+def validate_user_preferences_config(preferences_dict: Dict) -> UserPreferencesConfig:
+    """
+    Validate only the ``user.preferences`` section of a configuration.
+    
+    Args:
+        preferences_dict: User preferences dictionary to validate
+        
+    Returns:
+        Validated user preferences configuration object
+        
+    Raises:
+        ValidationError: If configuration is invalid
+    """
+    return UserPreferencesConfig.model_validate(preferences_dict)
+
+
+def validate_terraform_config(terraform_dict: Dict) -> TerraformConfig:
+    """
+    Validate only the ``terraform`` section of a configuration.
+    
+    Args:
+        terraform_dict: Terraform configuration dictionary to validate
+        
+    Returns:
+        Validated Terraform configuration object
+        
+    Raises:
+        ValidationError: If configuration is invalid
+    """
+    return TerraformConfig.model_validate(terraform_dict)
+
+
+# JSON schema for CloudCraverConfig, generated on first request
+_SCHEMA_CACHE: Optional[Dict] = None
 
 
 def get_config_schema() -> Dict:
     """
     Get the JSON schema for the configuration.
     
+    The schema is generated once and the same dictionary is returned on
+    subsequent calls; callers must not modify it.
+    
     Returns:
         JSON schema dictionary
     """
-    return CloudCraverConfig.schema()
+    global _SCHEMA_CACHE
+    if _SCHEMA_CACHE is None:
+        _SCHEMA_CACHE = CloudCraverConfig.model_json_schema()
+    return _SCHEMA_CACHE
 
 
 # Export validation functions
 __all__ = [
     'CloudCraverConfig',
+    'CloudCraverConfigFrozen',
     'validate_config', 
+    'validate_config_json',
+    'validate_config_trusted',
+    'validate_paths_config',
+    'validate_user_preferences_config',
+    'validate_terraform_config',
     'get_config_schema',
     'AppConfig',
     'CloudConfig',
@@ -3,6 +3,9 @@
 Simple configuration test script to debug issues.
 """
 
+# Diagnostic script run by hand (see SETUP.md), not part of the pytest suite
+__test__ = False
+
 def test_basic_imports():
     """Test basic Python imports first."""
     try:
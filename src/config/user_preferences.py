@@ -7,15 +7,28 @@ including default cloud providers, regions, and application settings.
 
 import json
 import os
+import sys
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Iterator
+from dataclasses import dataclass, fields
 from datetime import datetime
+from itertools import islice
 
 from . import config
+from .jsonio import json_dumps, json_loads
 
+# Allowed values checked by UserPreferencesManager.validate_preferences
+_VALID_PROVIDERS = frozenset(("aws", "azure", "gcp"))
+_VALID_THEMES = frozenset(("auto", "light", "dark"))
+_RECENT_FIELDS = ("recent_providers", "recent_regions", "recent_templates")
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older versions keep a per-instance __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class UserPreferences:
     """User preferences data class."""
     default_provider: str = "aws"
@@ -41,6 +54,25 @@ class UserPreferences:
             self.last_updated = datetime.now().isoformat()
 
 
+# Field names of UserPreferences, in declaration order
+_FIELDS = tuple(f.name for f in fields(UserPreferences))
+_FIELD_SET = frozenset(_FIELDS)
+
+
+def _to_dict(preferences: UserPreferences) -> Dict[str, Any]:
+    # All fields are flat values or lists of strings, so the recursive
+    # copy made by dataclasses.asdict() is unnecessary for serialization
+    return {name: getattr(preferences, name) for name in _FIELDS}
+
+
+def _from_dict(data: Dict[str, Any]) -> UserPreferences:
+    # Ignore keys this version doesn't know, e.g. from a newer release,
+    # instead of failing the whole load
+    if not isinstance(data, dict):
+        raise TypeError(f"Expected a JSON object, got {type(data).__name__}")
+    return UserPreferences(**{k: v for k, v in data.items() if k in _FIELD_SET})
+
+
 class UserPreferencesManager:
     """Manages user preferences with persistence and validation."""
     
@@ -56,8 +88,9 @@ class UserPreferencesManager:
         
         self.config_dir = config_dir
         self.preferences_file = config_dir / "user_preferences.json"
-        self.backup_file = config_dir / "user_preferences.backup.json"
         self._preferences = None
+        self._dirty = False
+        self._batch_depth = 0
     
     def get_preferences_file_path(self) -> Path:
         """Get the path to the user preferences file."""
@@ -70,22 +103,24 @@ class UserPreferencesManager:
         Returns:
             UserPreferences object
         """
-        if self._preferences is not None:
-            return self._preferences
+        preferences = self._preferences
+        if preferences is not None:
+            return preferences
         
-        if self.preferences_file.exists():
-            try:
-                with open(self.preferences_file, 'r') as f:
-                    data = json.load(f)
-                self._preferences = UserPreferences(**data)
-            except (json.JSONDecodeError, TypeError, ValueError) as e:
-                print(f"Warning: Could not load user preferences: {e}")
-                print("Using default preferences")
-                self._preferences = self._create_default_preferences()
-        else:
-            self._preferences = self._create_default_preferences()
+        # Open directly rather than probing with exists() first
+        try:
+            with open(self.preferences_file, 'rb') as f:
+                data = json_loads(f.read())
+            preferences = _from_dict(data)
+        except FileNotFoundError:
+            preferences = self._create_default_preferences()
+        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            print(f"Warning: Could not load user preferences: {e}")
+            print("Using default preferences")
+            preferences = self._create_default_preferences()
         
-        return self._preferences
+        self._preferences = preferences
+        return preferences
     
     def save_preferences(self, preferences: Optional[UserPreferences] = None) -> bool:
         """
@@ -104,34 +139,70 @@ class UserPreferencesManager:
         preferences.last_updated = datetime.now().isoformat()
         
         try:
-            # Create backup if file exists
-            if self.preferences_file.exists():
-                self.preferences_file.rename(self.backup_file)
-            
             # Ensure config directory exists
             self.config_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save preferences
-            with open(self.preferences_file, 'w') as f:
-                json.dump(asdict(preferences), f, indent=2)
+            # Write to a uniquely named temporary file and swap it in, so the
+            # existing preferences stay intact until the new ones are complete
+            # and concurrent saves never share a partially written file
+            fd, temp_file = tempfile.mkstemp(
+                dir=self.config_dir, prefix=f"{self.preferences_file.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(json_dumps(_to_dict(preferences)))
+                os.replace(temp_file, self.preferences_file)
+            except Exception:
+                try:
+                    os.unlink(temp_file)
+                except OSError:
+                    pass
+                raise
             
             self._preferences = preferences
-            
-            # Remove backup on successful save
-            if self.backup_file.exists():
-                self.backup_file.unlink()
+            self._dirty = False
             
             return True
             
         except Exception as e:
             print(f"Error saving user preferences: {e}")
-            
-            # Restore backup if save failed
-            if self.backup_file.exists() and not self.preferences_file.exists():
-                self.backup_file.rename(self.preferences_file)
-            
             return False
     
+    def flush(self) -> bool:
+        """
+        Write pending preference changes to file.
+        
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        if not self._dirty:
+            return True
+        return self.save_preferences()
+    
+    @contextmanager
+    def batch(self) -> Iterator["UserPreferencesManager"]:
+        """
+        Group several preference changes into a single write.
+        
+        Changes made inside the block are kept in memory and written once
+        when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+    
+    def _commit(self, preferences: UserPreferences) -> bool:
+        """Record changed preferences, writing them unless inside a batch."""
+        self._preferences = preferences
+        self._dirty = True
+        if self._batch_depth:
+            return True
+        return self.save_preferences(preferences)
+    
     def update_preference(self, key: str, value: Any) -> bool:
         """
         Update a specific preference.
@@ -147,7 +218,7 @@ class UserPreferencesManager:
         
         if hasattr(preferences, key):
             setattr(preferences, key, value)
-            return self.save_preferences(preferences)
+            return self._commit(preferences)
         else:
             print(f"Warning: Unknown preference key: {key}")
             return False
@@ -171,21 +242,12 @@ class UserPreferencesManager:
             print(f"Warning: Unknown recent item type: {item_type}")
             return False
         
-        recent_list = getattr(preferences, attr_name)
-        
-        # Remove item if it already exists
-        if item in recent_list:
-            recent_list.remove(item)
+        # Put item first and drop its older occurrence in one pass;
+        # dict keys keep insertion order
+        recent = dict.fromkeys((item, *getattr(preferences, attr_name)))
+        setattr(preferences, attr_name, list(islice(recent, max_items)))
         
-        # Add item to the beginning
-        recent_list.insert(0, item)
-        
-        # Limit the list size
-        if len(recent_list) > max_items:
-            recent_list = recent_list[:max_items]
-            setattr(preferences, attr_name, recent_list)
-        
-        return self.save_preferences(preferences)
+        return self._commit(preferences)
     
     def get_recent_items(self, item_type: str) -> List[str]:
         """
@@ -213,8 +275,7 @@ class UserPreferencesManager:
         Returns:
             True if reset successfully, False otherwise
         """
-        self._preferences = self._create_default_preferences()
-        return self.save_preferences()
+        return self._commit(self._create_default_preferences())
     
     def export_preferences(self, file_path: Path) -> bool:
         """
@@ -229,8 +290,8 @@ class UserPreferencesManager:
         preferences = self.load_preferences()
         
         try:
-            with open(file_path, 'w') as f:
-                json.dump(asdict(preferences), f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(json_dumps(_to_dict(preferences)))
             return True
         except Exception as e:
             print(f"Error exporting preferences: {e}")
@@ -247,11 +308,11 @@ class UserPreferencesManager:
             True if imported successfully, False otherwise
         """
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
             
-            preferences = UserPreferences(**data)
-            return self.save_preferences(preferences)
+            preferences = _from_dict(data)
+            return self._commit(preferences)
             
         except Exception as e:
             print(f"Error importing preferences: {e}")
@@ -287,17 +348,15 @@ class UserPreferencesManager:
         errors = []
         
         # Validate default provider
-        valid_providers = ["aws", "azure", "gcp"]
-        if preferences.default_provider not in valid_providers:
-            errors.append(f"Invalid default provider: {preferences.default_provider}. Must be one of: {valid_providers}")
+        if preferences.default_provider not in _VALID_PROVIDERS:
+            errors.append(f"Invalid default provider: {preferences.default_provider}. Must be one of: {sorted(_VALID_PROVIDERS)}")
         
         # Validate theme
-        valid_themes = ["auto", "light", "dark"]
-        if preferences.theme not in valid_themes:
-            errors.append(f"Invalid theme: {preferences.theme}. Must be one of: {valid_themes}")
+        if preferences.theme not in _VALID_THEMES:
+            errors.append(f"Invalid theme: {preferences.theme}. Must be one of: {sorted(_VALID_THEMES)}")
         
         # Validate recent items lists
-        for attr_name in ['recent_providers', 'recent_regions', 'recent_templates']:
+        for attr_name in _RECENT_FIELDS:
             attr_value = getattr(preferences, attr_name)
             if not isinstance(attr_value, list):
                 errors.append(f"{attr_name} must be a list")
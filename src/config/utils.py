@@ -6,14 +6,126 @@ including file discovery, validation helpers, and configuration merging.
 """
 
 import os
+import copy
+import string
 import json
+from collections import OrderedDict
 import yaml
 import toml
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 
 from . import config
+from .jsonio import json_loads
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Prefer libyaml's C parser when PyYAML was built with it; the pure-Python
+# SafeLoader is an order of magnitude slower on large files.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# tomllib/tomli parse far faster than the pure-Python toml package, which
+# remains the fallback (and is still used for writing TOML).
+_toml_loads = tomllib.loads if tomllib is not None else toml.loads
+
+# Configuration file type by (lower-cased) file extension
+_CONFIG_FILE_TYPES = {
+    ".toml": "toml",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+}
+
+# Parsed TOML/YAML files keyed by absolute path, stored alongside the
+# (mtime_ns, size) signature of the file they were parsed from. JSON is left
+# out: orjson parses it faster than the copy a cache hit has to return.
+# Least recently used entries are evicted past _PARSE_CACHE_SIZE.
+_PARSE_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+_PARSE_CACHE_SIZE = 64
+_CACHED_FILE_TYPES = frozenset({"toml", "yaml"})
+
+# discover_config_files results keyed by the searched paths, stored alongside
+# the mtime_ns of each directory (None when missing) at scan time.
+_DISCOVERY_CACHE: Dict[Tuple[str, ...], Tuple[Tuple[Optional[int], ...], Dict[str, List[Path]]]] = {}
+
+
+# Configuration keys left out of export_config() unless secrets are requested
+_SENSITIVE_PATHS: Tuple[Tuple[str, ...], ...] = (
+    ("cloud", "aws", "access_key_id"),
+    ("cloud", "aws", "secret_access_key"),
+    ("cloud", "azure", "client_secret"),
+    ("cloud", "gcp", "service_account_key"),
+)
+
+# Lower-cases ASCII letters and turns underscores into dots, for
+# normalize_config_key
+_NORMALIZE_TABLE = str.maketrans(string.ascii_uppercase + "_", string.ascii_lowercase + ".")
+
+# Marker for keys absent from a dict, distinct from a stored None
+_MISSING = object()
+
+
+def _dir_mtime(path: Union[str, Path]) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _default_search_paths() -> List[Union[str, Path]]:
+    return [
+        Path.cwd(),
+        Path.home() / ".cloudcraver",
+        Path(__file__).parent,
+        "/etc/cloudcraver"
+    ]
+
+
+def iter_config_files(search_paths: Optional[List[Union[str, Path]]] = None) -> Iterator[Tuple[str, Path]]:
+    """
+    Lazily discover configuration files in specified search paths.
+    
+    Files are yielded as they are found, so callers that stop at the first
+    match don't pay for scanning every search path.
+    
+    Args:
+        search_paths: Optional list of paths to search for config files
+        
+    Yields:
+        (file type, path) tuples
+    """
+    if search_paths is None:
+        search_paths = _default_search_paths()
+    
+    for search_path in search_paths:
+        # One directory listing per search path; DirEntry caches the file
+        # type, so classifying entries costs no further syscalls
+        try:
+            entries = os.scandir(search_path)
+        except OSError:
+            # Missing, not a directory, or unreadable
+            continue
+        
+        with entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                
+                name = entry.name
+                file_type = _CONFIG_FILE_TYPES.get(os.path.splitext(name)[1].lower())
+                if file_type is not None:
+                    yield file_type, Path(entry.path)
+                
+                # .env, .env.* and *.env files
+                if name.startswith(".env.") or name.endswith(".env"):
+                    yield "env", Path(entry.path)
 
 
 def discover_config_files(search_paths: Optional[List[Union[str, Path]]] = None) -> Dict[str, List[Path]]:
@@ -27,15 +139,15 @@ def discover_config_files(search_paths: Optional[List[Union[str, Path]]] = None)
         Dictionary mapping file types to lists of discovered files
     """
     if search_paths is None:
-        search_paths = [
-            Path.cwd(),
-            Path.home() / ".cloudcraver",
-            Path(__file__).parent,
-            "/etc/cloudcraver"
-        ]
+        search_paths = _default_search_paths()
     
-    # Convert to Path objects
-    search_paths = [Path(p) for p in search_paths]
+    # A directory's mtime changes whenever entries are added, removed or
+    # renamed, so an unchanged signature means the previous scan still holds
+    cache_key = tuple(os.fspath(p) for p in search_paths)
+    signature = tuple(_dir_mtime(p) for p in cache_key)
+    cached = _DISCOVERY_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return {file_type: list(files) for file_type, files in cached[1].items()}
     
     discovered_files = {
         "toml": [],
@@ -44,23 +156,13 @@ def discover_config_files(search_paths: Optional[List[Union[str, Path]]] = None)
         "env": []
     }
     
-    config_file_patterns = {
-        "toml": ["*.toml", "settings.toml", "config.toml", "local_settings.toml"],
-        "yaml": ["*.yaml", "*.yml", "config.yaml", "config.yml"],
-        "json": ["*.json", "config.json", "settings.json"],
-        "env": [".env", ".env.*", "*.env"]
-    }
-    
-    for search_path in search_paths:
-        if not search_path.exists() or not search_path.is_dir():
-            continue
-            
-        for file_type, patterns in config_file_patterns.items():
-            for pattern in patterns:
-                for file_path in search_path.glob(pattern):
-                    if file_path.is_file():
-                        discovered_files[file_type].append(file_path)
+    for file_type, file_path in iter_config_files(search_paths):
+        discovered_files[file_type].append(file_path)
     
+    _DISCOVERY_CACHE[cache_key] = (
+        signature,
+        {file_type: list(files) for file_type, files in discovered_files.items()},
+    )
     return discovered_files
 
 
@@ -80,24 +182,59 @@ def load_config_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
     file_path = Path(file_path)
     
-    if not file_path.exists():
+    try:
+        file_stat = file_path.stat()
+    except OSError:
         raise FileNotFoundError(f"Configuration file not found: {file_path}")
     
     file_extension = file_path.suffix.lower()
+    file_type = _CONFIG_FILE_TYPES.get(file_extension)
+    if file_type is None:
+        raise ValueError(f"Unsupported configuration file format: {file_extension}")
+    
+    # Reuse the previous parse while the file is unchanged on disk
+    cache_key = os.path.abspath(file_path)
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+    use_cache = file_type in _CACHED_FILE_TYPES
+    if use_cache:
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            _PARSE_CACHE.move_to_end(cache_key)
+            return copy.deepcopy(cached[1])
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            if file_extension == '.toml':
-                return toml.load(f)
-            elif file_extension in ['.yaml', '.yml']:
-                return yaml.safe_load(f) or {}
-            elif file_extension == '.json':
-                return json.load(f)
-            else:
-                raise ValueError(f"Unsupported configuration file format: {file_extension}")
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        if file_type == 'toml':
+            data = _toml_loads(raw.decode('utf-8'))
+        elif file_type == 'yaml':
+            data = yaml.load(raw, Loader=_YAML_LOADER) or {}
+        else:
+            data = json_loads(raw)
                 
     except Exception as e:
         raise ValueError(f"Error loading configuration file {file_path}: {e}")
+    
+    if not use_cache:
+        return data
+    
+    # The fresh parse becomes the cached copy; callers get their own
+    _PARSE_CACHE[cache_key] = (signature, data)
+    _PARSE_CACHE.move_to_end(cache_key)
+    if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+def clear_config_file_cache() -> None:
+    """Forget all parsed configuration files cached by load_config_file."""
+    _PARSE_CACHE.clear()
+
+
+def clear_discovery_cache() -> None:
+    """Forget all directory scans cached by discover_config_files."""
+    _DISCOVERY_CACHE.clear()
 
 
 def save_config_file(config_data: Dict[str, Any], file_path: Union[str, Path], 
@@ -158,24 +295,27 @@ def merge_configs(*configs: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Merged configuration dictionary
     """
-    def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively merge two dictionaries."""
-        result = base.copy()
-        
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = deep_merge(result[key], value)
-            else:
-                result[key] = value
-        
-        return result
-    
-    if not configs:
-        return {}
-    
-    result = configs[0].copy()
-    for config_dict in configs[1:]:
-        result = deep_merge(result, config_dict)
+    result: Dict[str, Any] = {}
+    
+    # Sections merged into are copied once, the first time an override
+    # lands in them; the input dicts themselves are never modified.
+    # Keyed by id, holding the dict so ids stay unique during the merge.
+    owned = {id(result): result}
+    
+    for config_dict in configs:
+        stack = [(result, config_dict)]
+        while stack:
+            target, override = stack.pop()
+            for key, value in override.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    if id(current) not in owned:
+                        current = dict(current)
+                        owned[id(current)] = current
+                        target[key] = current
+                    stack.append((current, value))
+                else:
+                    target[key] = value
     
     return result
 
@@ -303,16 +443,17 @@ def get_environment_variables(prefix: str = "CLOUDCRAVER") -> Dict[str, str]:
     Returns:
         Dictionary of environment variables
     """
-    env_vars = {}
     prefix_with_separator = f"{prefix}_"
-    
-    for key, value in os.environ.items():
-        if key.startswith(prefix_with_separator):
-            # Remove prefix and convert to lowercase
-            config_key = key[len(prefix_with_separator):].lower()
-            env_vars[config_key] = value
-    
-    return env_vars
+    prefix_length = len(prefix_with_separator)
+    environ = os.environ
+    
+    # Filter on keys alone so values are only decoded for matching variables;
+    # the prefix is removed and the rest converted to lowercase
+    return {
+        key[prefix_length:].lower(): environ[key]
+        for key in environ
+        if key.startswith(prefix_with_separator)
+    }
 
 
 def normalize_config_key(key: str) -> str:
@@ -325,8 +466,8 @@ def normalize_config_key(key: str) -> str:
     Returns:
         Normalized key
     """
-    # Convert to lowercase and replace underscores with dots
-    return key.lower().replace('_', '.')
+    # Convert to lowercase and replace underscores with dots in one pass
+    return key.translate(_NORMALIZE_TABLE)
 
 
 def get_config_diff(config1: Dict[str, Any], config2: Dict[str, Any]) -> Dict[str, Any]:
@@ -340,29 +481,49 @@ def get_config_diff(config1: Dict[str, Any], config2: Dict[str, Any]) -> Dict[st
     Returns:
         Dictionary containing the differences
     """
-    def dict_diff(d1: Dict, d2: Dict, path: str = "") -> Dict[str, Any]:
-        diff = {}
+    diff = {}
+    
+    # Walk nested sections with an explicit stack instead of recursion
+    stack = [(config1, config2, "")]
+    while stack:
+        d1, d2, path = stack.pop()
+        prefix = path + "." if path else ""
         
         # Check for keys in d1 but not in d2
-        for key in d1:
-            current_path = f"{path}.{key}" if path else key
-            if key not in d2:
-                diff[f"removed.{current_path}"] = d1[key]
-            elif isinstance(d1[key], dict) and isinstance(d2[key], dict):
-                nested_diff = dict_diff(d1[key], d2[key], current_path)
-                diff.update(nested_diff)
-            elif d1[key] != d2[key]:
-                diff[f"changed.{current_path}"] = {"old": d1[key], "new": d2[key]}
+        for key, old in d1.items():
+            new = d2.get(key, _MISSING)
+            if new is _MISSING:
+                diff[f"removed.{prefix}{key}"] = old
+            elif isinstance(old, dict) and isinstance(new, dict):
+                stack.append((old, new, f"{prefix}{key}"))
+            elif old != new:
+                diff[f"changed.{prefix}{key}"] = {"old": old, "new": new}
         
         # Check for keys in d2 but not in d1
-        for key in d2:
-            current_path = f"{path}.{key}" if path else key
+        for key, new in d2.items():
             if key not in d1:
-                diff[f"added.{current_path}"] = d2[key]
-        
-        return diff
+                diff[f"added.{prefix}{key}"] = new
     
-    return dict_diff(config1, config2)
+    return diff
+
+
+def _drop_path(data: Dict[str, Any], path: Tuple[str, ...]) -> None:
+    """Remove a nested key, copying the dicts along its path first."""
+    # Dynaconf upper-cases keys that come from the environment, so a
+    # settings file and an env var can leave several spellings side by side
+    name = path[0].lower()
+    matches = [key for key in data if isinstance(key, str) and key.lower() == name]
+    for key in matches:
+        if len(path) == 1:
+            del data[key]
+            continue
+        child = data[key]
+        if not isinstance(child, dict):
+            continue
+        # Shallow copies keep the live configuration untouched
+        child = dict(child)
+        data[key] = child
+        _drop_path(child, path[1:])
 
 
 def export_config(output_file: Union[str, Path], include_secrets: bool = False, 
@@ -384,25 +545,8 @@ def export_config(output_file: Union[str, Path], include_secrets: bool = False,
         
         # Remove secrets if not requested
         if not include_secrets:
-            # Remove sensitive keys
-            sensitive_keys = [
-                'cloud.aws.access_key_id',
-                'cloud.aws.secret_access_key',
-                'cloud.azure.client_secret',
-                'cloud.gcp.service_account_key'
-            ]
-            
-            for key in sensitive_keys:
-                keys = key.split('.')
-                current = config_data
-                for k in keys[:-1]:
-                    if k in current and isinstance(current[k], dict):
-                        current = current[k]
-                    else:
-                        break
-                else:
-                    if keys[-1] in current:
-                        del current[keys[-1]]
+            for path in _SENSITIVE_PATHS:
+                _drop_path(config_data, path)
         
         return save_config_file(config_data, output_file, file_format)
         
@@ -413,8 +557,11 @@ def export_config(output_file: Union[str, Path], include_secrets: bool = False,
 
 # Export all utility functions
 __all__ = [
+    'iter_config_files',
     'discover_config_files',
     'load_config_file',
+    'clear_config_file_cache',
+    'clear_discovery_cache',
     'save_config_file',
     'merge_configs',
     'get_config_value',
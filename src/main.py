@@ -1,4 +1,3 @@
-from templates.base import AWSTemplate, AzureTemplate, GCPTemplate, TemplateMetadata
 import click
 import os
 
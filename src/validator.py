@@ -1,26 +1,85 @@
+import heapq
+import shutil
 import subprocess
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses in C; both parsers accept the raw bytes of tool output
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# Executables found on PATH, by tool name
+_TOOL_PATHS = {}
+
+
+def _resolve_tool(name):
+    # Search PATH once per installed tool and process. Misses aren't
+    # remembered, so a tool installed while the process runs is picked up.
+    path = _TOOL_PATHS.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _TOOL_PATHS[name] = path
+    return path
+
+
+# tfsec severities from most to least severe
+_SEVERITY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+
+# Findings kept per tool in a report entry
+_MAX_REPORTED_RESULTS = 20
+
+# Report order of the external tools run by validate_all
+_EXTERNAL_TOOLS = ("terraform validate", "tfsec", "checkov")
+
 
 class TerraformValidator:
     def __init__(self, terraform_path):
         self.terraform_path = terraform_path
         self.reports = []
+        self._reports_lock = threading.Lock()
 
-    def _run_command(self, command, cwd=None):
+    def _run_command(self, command, cwd=None, raw_stdout=False):
+        # With raw_stdout, stdout is returned as bytes so JSON output can be
+        # parsed without first being decoded into a second large string
+        executable = _resolve_tool(command[0])
         try:
+            if executable is None:
+                raise FileNotFoundError(command[0])
             process = subprocess.run(
-                command,
+                [executable, *command[1:]],
                 cwd=cwd,
                 capture_output=True,
-                text=True,
                 check=True
             )
-            return process.stdout, process.stderr
+            stdout, stderr = process.stdout, process.stderr
         except subprocess.CalledProcessError as e:
-            return e.stdout, e.stderr
+            stdout, stderr = e.stdout, e.stderr
         except FileNotFoundError:
-            return "", f"Error: Command not found. Please ensure '{command[0]}' is installed and in your PATH."
+            stdout = b"" if raw_stdout else ""
+            return stdout, f"Error: Command not found. Please ensure '{command[0]}' is installed and in your PATH."
+        
+        if not raw_stdout:
+            stdout = stdout.decode(errors="replace")
+        return stdout, stderr.decode(errors="replace")
+
+    def _add_report(self, report_entry):
+        # The external tool checks run concurrently in validate_all
+        with self._reports_lock:
+            self.reports.append(report_entry)
 
     def validate_terraform_syntax(self):
         print(f"Running terraform validate in {self.terraform_path}...")
@@ -41,12 +100,12 @@ class TerraformValidator:
             report_entry["severity"] = "WARNING"
             report_entry["message"] = "Terraform syntax validation completed with warnings."
         
-        self.reports.append(report_entry)
+        self._add_report(report_entry)
         return report_entry["severity"] != "ERROR"
 
     def run_tfsec(self):
         print(f"Running tfsec in {self.terraform_path}...")
-        stdout, stderr = self._run_command(["tfsec", "--format=json", self.terraform_path])
+        stdout, stderr = self._run_command(["tfsec", "--format=json", self.terraform_path], raw_stdout=True)
         
         report_entry = {
             "tool": "tfsec",
@@ -62,26 +121,36 @@ class TerraformValidator:
             report_entry["details"] = stderr
         else:
             try:
-                tfsec_output = json.loads(stdout)
-                report_entry["details"] = tfsec_output
-                if tfsec_output.get("results"):
-                    report_entry["severity"] = "CRITICAL" if any(r.get("severity") == "CRITICAL" for r in tfsec_output["results"]) else \
-                                               "HIGH" if any(r.get("severity") == "HIGH" for r in tfsec_output["results"]) else \
-                                               "MEDIUM" if any(r.get("severity") == "MEDIUM" for r in tfsec_output["results"]) else \
-                                               "LOW" if any(r.get("severity") == "LOW" for r in tfsec_output["results"]) else \
-                                               "UNKNOWN"
-                    report_entry["message"] = f"tfsec found {len(tfsec_output['results'])} issues."
-            except json.JSONDecodeError:
+                tfsec_output = _json_loads(stdout)
+                results = tfsec_output.get("results") or []
+                # Report the most severe findings rather than the full output.
+                # One heap pass picks them without sorting every result, and
+                # the first one carries the overall severity.
+                top_results = heapq.nsmallest(
+                    _MAX_REPORTED_RESULTS, results,
+                    key=lambda r: _SEVERITY_RANK.get(r.get("severity"), len(_SEVERITY_RANK)),
+                )
+                report_entry["details"] = {
+                    "results_count": len(results),
+                    "results": top_results,
+                }
+                if results:
+                    top_severity = top_results[0].get("severity")
+                    report_entry["severity"] = top_severity if top_severity in _SEVERITY_RANK else "UNKNOWN"
+                    report_entry["message"] = f"tfsec found {len(results)} issues."
+            # JSONDecodeError, or UnicodeDecodeError when the stdlib parser
+            # gets non-UTF-8 bytes
+            except ValueError:
                 report_entry["severity"] = "ERROR"
                 report_entry["message"] = "tfsec output is not valid JSON."
-                report_entry["details"] = stdout
+                report_entry["details"] = stdout.decode(errors="replace")
         
-        self.reports.append(report_entry)
+        self._add_report(report_entry)
         return report_entry["severity"] not in ["ERROR", "CRITICAL", "HIGH"]
 
     def run_checkov(self):
         print(f"Running checkov in {self.terraform_path}...")
-        stdout, stderr = self._run_command(["checkov", "-d", self.terraform_path, "-o", "json"])
+        stdout, stderr = self._run_command(["checkov", "-d", self.terraform_path, "-o", "json"], raw_stdout=True)
         
         report_entry = {
             "tool": "checkov",
@@ -97,21 +166,28 @@ class TerraformValidator:
             report_entry["details"] = stderr
         else:
             try:
-                checkov_output = json.loads(stdout)
-                report_entry["details"] = checkov_output
-                summary = checkov_output[0].get("summary", {}) if checkov_output else {}
+                checkov_output = _json_loads(stdout)
+                first_report = checkov_output[0] if checkov_output else {}
+                summary = first_report.get("summary", {})
+                # Passed checks make up most of checkov's output; report only
+                # the summary and the checks that failed
+                failed_checks = first_report.get("results", {}).get("failed_checks", [])
+                report_entry["details"] = {
+                    "summary": summary,
+                    "failed_checks": failed_checks[:_MAX_REPORTED_RESULTS],
+                }
                 
                 if summary.get("failed", 0) > 0:
                     report_entry["severity"] = "HIGH" # Checkov doesn't have explicit severity levels in summary, so we'll use HIGH for failures
                     report_entry["message"] = f"checkov found {summary.get('failed', 0)} failed checks."
                 elif summary.get("passed", 0) > 0:
                     report_entry["message"] = f"checkov passed {summary.get('passed', 0)} checks."
-            except json.JSONDecodeError:
+            except ValueError:
                 report_entry["severity"] = "ERROR"
                 report_entry["message"] = "checkov output is not valid JSON."
-                report_entry["details"] = stdout
+                report_entry["details"] = stdout.decode(errors="replace")
         
-        self.reports.append(report_entry)
+        self._add_report(report_entry)
         return report_entry["severity"] != "ERROR" and report_entry["severity"] != "HIGH"
 
     def validate_naming_conventions(self):
@@ -125,7 +201,7 @@ class TerraformValidator:
             "details": "Implement actual naming convention checks here.",
             "errors": ""
         }
-        self.reports.append(report_entry)
+        self._add_report(report_entry)
         return True
 
     def validate_tagging_standards(self):
@@ -139,7 +215,7 @@ class TerraformValidator:
             "details": "Implement actual tagging standards checks here.",
             "errors": ""
         }
-        self.reports.append(report_entry)
+        self._add_report(report_entry)
         return True
 
     def validate_dependencies(self):
@@ -152,7 +228,7 @@ class TerraformValidator:
             "details": "Implement actual dependency and circular dependency checks here.",
             "errors": ""
         }
-        self.reports.append(report_entry)
+        self._add_report(report_entry)
         return True
 
     def provide_performance_recommendations(self):
@@ -165,7 +241,7 @@ class TerraformValidator:
             "details": "Implement actual performance recommendations here (e.g., resource sizing, networking best practices).",
             "errors": ""
         }
-        self.reports.append(report_entry)
+        self._add_report(report_entry)
         return True
 
     def generate_report(self):
@@ -175,7 +251,7 @@ class TerraformValidator:
             print(f"Severity: {entry['severity']}")
             print(f"Message: {entry['message']}")
             if entry['details']:
-                print(f"Details: {json.dumps(entry['details'], indent=2)}")
+                print(f"Details: {_json_dumps(entry['details'])}")
             if entry['errors']:
                 print(f"Errors: {entry['errors']}")
             print("-" * 20)
@@ -185,10 +261,16 @@ class TerraformValidator:
         print("Starting comprehensive Terraform validation...")
         self.reports = [] # Clear previous reports
         
-        # Run all validation checks
-        self.validate_terraform_syntax()
-        self.run_tfsec()
-        self.run_checkov()
+        # Run all validation checks. The external tools are independent
+        # subprocesses, so run them side by side and wait for the slowest.
+        external_checks = (self.validate_terraform_syntax, self.run_tfsec, self.run_checkov)
+        with ThreadPoolExecutor(max_workers=len(external_checks)) as executor:
+            futures = [executor.submit(check) for check in external_checks]
+            for future in futures:
+                future.result()
+        # Keep the report order independent of which tool finished first
+        self.reports.sort(key=lambda entry: _EXTERNAL_TOOLS.index(entry["tool"]))
+        
         self.validate_naming_conventions()
         self.validate_tagging_standards()
         self.validate_dependencies()
@@ -15,13 +15,22 @@ import os
 import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+from dynaconf import Dynaconf
 
 # Import the configuration modules
 import sys
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from src.config import config, settings, get_cloud_config, get_user_preferences, get_config_sources
-from src.config.schema import validate_config, get_config_schema, CloudCraverConfig
+from src.config.schema import (
+    validate_config, validate_config_json, validate_config_trusted, validate_paths_config,
+    get_config_schema, CloudCraverConfig, PathsConfig,
+)
+from src.config.cli_config import CLIConfigManager
+from src.config.utils import (
+    discover_config_files, iter_config_files, export_config, get_config_diff, load_config_file, merge_configs,
+    get_environment_variables, normalize_config_key,
+)
 from src.config.user_preferences import (
     UserPreferences, 
     UserPreferencesManager, 
@@ -66,15 +75,40 @@ class TestConfigurationLoading:
     def test_config_sources_order(self):
         """Test configuration sources precedence order."""
         sources = get_config_sources()
-        expected_sources = [
+        expected_sources = (
             "CLI arguments",
             "Environment variables", 
             "local_settings.toml",
             "settings.toml",
             "config.yaml",
             "base_config.toml"
-        ]
+        )
         assert sources == expected_sources
+        assert get_config_sources() is sources
+        
+    def test_dynaconf_is_loaded_lazily(self):
+        """Test that importing the config package and CLI module does not build Dynaconf."""
+        import subprocess
+        code = "import sys, src.config.cli_config; assert 'dynaconf' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True,
+                       cwd=str(Path(__file__).parent.parent))
+        
+    def test_reload_picks_up_new_settings_files(self, tmp_path):
+        """Test that reload_config() loads override files created after startup."""
+        import src.config as config_module
+        local_settings = tmp_path / "local_settings.toml"
+        candidates = config_module._SETTINGS_FILE_CANDIDATES + (str(local_settings),)
+        config_module.reload_config()
+        assert config.get("reload_marker") is None
+        
+        try:
+            with patch.object(config_module, "_SETTINGS_FILE_CANDIDATES", candidates):
+                local_settings.write_text('reload_marker = "local"\n')
+                config_module.reload_config()
+                assert config.get("reload_marker") == "local"
+        finally:
+            config_module.reload_config()
+        assert config.get("reload_marker") is None
 
 
 class TestConfigurationValidation:
@@ -104,6 +138,10 @@ class TestConfigurationValidation:
         assert isinstance(validated, CloudCraverConfig)
         assert validated.app.name == "Test App"
         
+        # Top-level sections of validated configs cannot be reassigned
+        with pytest.raises(Exception):
+            validated.app = validated.app
+        
     def test_schema_validation_invalid_provider(self):
         """Test schema validation with invalid cloud provider."""
         invalid_config = {
@@ -131,6 +169,57 @@ class TestConfigurationValidation:
         with pytest.raises(Exception):  # Should raise validation error
             validate_config(invalid_config)
             
+    def test_schema_validation_from_json(self):
+        """Test schema validation of a JSON document."""
+        validated = validate_config_json(
+            b'{"app": {"name": "Test App", "version": "1.0.0"}, "cloud": {"providers": ["aws", "gcp"]}}'
+        )
+        assert isinstance(validated, CloudCraverConfig)
+        assert validated.cloud.providers == ["aws", "gcp"]
+        
+        with pytest.raises(Exception):  # Should raise validation error
+            validate_config_json(b'{"app": {}}')
+            
+    def test_trusted_config_skips_validation(self):
+        """Test building a config from already validated sections."""
+        validated = validate_config({"app": {"name": "Test App", "version": "1.0.0"}})
+        trusted = validate_config_trusted(dict(validated))
+        assert isinstance(trusted, CloudCraverConfig)
+        assert trusted.app is validated.app
+        assert trusted.paths.output_dir == "output"
+        
+    def test_section_validation(self):
+        """Test validating a single configuration section."""
+        paths = validate_paths_config({"output_dir": "build"})
+        assert isinstance(paths, PathsConfig)
+        assert paths.output_dir == "build"
+        assert paths.templates_dir == "templates"
+        
+        with pytest.raises(Exception):  # Should raise validation error
+            validate_paths_config({"output_dir": ""})
+            
+    def test_resource_name_pattern_compiled_once(self):
+        """Test the naming pattern is validated and compiled once."""
+        validated = validate_config({"app": {"name": "Test App", "version": "1.0.0"}})
+        naming = validated.validation.naming_conventions
+        regex = naming.resource_name_regex
+        assert regex.match("web-server-1")
+        assert not regex.match("Web_Server")
+        assert naming.resource_name_regex is regex
+        
+        # Reassigning the pattern is validated and updates the compiled regex
+        naming.resource_name_pattern = "^x$"
+        assert naming.resource_name_regex.pattern == "^x$"
+        with pytest.raises(Exception):
+            naming.resource_name_pattern = "[a-z"
+        assert naming.resource_name_regex.pattern == "^x$"
+        
+        with pytest.raises(Exception):  # Should raise validation error
+            validate_config({
+                "app": {"name": "Test App", "version": "1.0.0"},
+                "validation": {"naming_conventions": {"resource_name_pattern": "[a-z"}},
+            })
+            
     def test_get_config_schema(self):
         """Test getting JSON schema for configuration."""
         schema = get_config_schema()
@@ -138,6 +227,7 @@ class TestConfigurationValidation:
         assert "properties" in schema
         assert "app" in schema["properties"]
         assert "cloud" in schema["properties"]
+        assert get_config_schema() is schema
 
 
 class TestUserPreferences:
@@ -202,6 +292,7 @@ class TestUserPreferences:
             # Save preferences
             success = manager.save_preferences(prefs)
             assert success == True
+            assert [p.name for p in self.config_dir.iterdir()] == ["user_preferences.json"]
             
             # Clear cached preferences
             manager._preferences = None
@@ -215,6 +306,53 @@ class TestUserPreferences:
         finally:
             self.tearDown()
             
+    def test_load_preferences_ignores_unknown_keys(self):
+        """Test loading a preferences file with keys from a newer version."""
+        self.setUp()
+        try:
+            manager = UserPreferencesManager(self.config_dir)
+            manager.preferences_file.write_text(
+                '{"default_provider": "azure", "future_option": true}'
+            )
+            
+            prefs = manager.load_preferences()
+            assert prefs.default_provider == "azure"
+            
+        finally:
+            self.tearDown()
+            
+    def test_failed_save_leaves_no_temp_file(self):
+        """Test that a failed save keeps the old file and cleans up after itself."""
+        self.setUp()
+        try:
+            manager = UserPreferencesManager(self.config_dir)
+            assert manager.save_preferences(UserPreferences(default_provider="gcp"))
+            
+            with patch("os.replace", side_effect=OSError("disk full")):
+                assert not manager.save_preferences(UserPreferences(default_provider="azure"))
+            
+            assert [p.name for p in self.config_dir.iterdir()] == ["user_preferences.json"]
+            manager._preferences = None
+            assert manager.load_preferences().default_provider == "gcp"
+            
+        finally:
+            self.tearDown()
+            
+    def test_load_preferences_non_object_falls_back_to_defaults(self):
+        """Test that valid JSON which is not an object yields defaults."""
+        self.setUp()
+        try:
+            for payload in ("null", "[]", '"x"'):
+                manager = UserPreferencesManager(self.config_dir)
+                manager.preferences_file.write_text(payload)
+                
+                prefs = manager.load_preferences()
+                assert prefs.recent_templates == []
+                assert manager.validate_preferences(prefs) == []
+            
+        finally:
+            self.tearDown()
+            
     def test_update_preference(self):
         """Test updating a specific preference."""
         self.setUp()
@@ -252,6 +390,31 @@ class TestUserPreferences:
             recent = manager.get_recent_items("providers")
             assert recent == ["aws", "gcp", "azure"]
             
+            # Oldest entries fall off once the limit is reached
+            manager.add_recent_item("providers", "azure", max_items=2)
+            recent = manager.get_recent_items("providers")
+            assert recent == ["azure", "aws"]
+            
+        finally:
+            self.tearDown()
+            
+    def test_batch_writes_once(self):
+        """Test that changes inside a batch are written when it exits."""
+        self.setUp()
+        try:
+            manager = UserPreferencesManager(self.config_dir)
+            
+            with manager.batch():
+                manager.update_preference("theme", "dark")
+                manager.add_recent_item("regions", "eu-west-1")
+                assert not manager.preferences_file.exists()
+            
+            assert manager.preferences_file.exists()
+            manager._preferences = None
+            prefs = manager.load_preferences()
+            assert prefs.theme == "dark"
+            assert prefs.recent_regions == ["eu-west-1"]
+            
         finally:
             self.tearDown()
             
@@ -322,6 +485,296 @@ class TestConfigurationFileDiscovery:
         pass
 
 
+class TestConfigFileLoading:
+    """Test loading configuration files from disk."""
+    
+    def test_discover_config_files(self, tmp_path):
+        """Test that config files are grouped by type, once each."""
+        for name in ["settings.toml", "config.yml", "extra.YAML", "config.json",
+                     ".env", ".env.local", "prod.env", "notes.txt"]:
+            (tmp_path / name).write_text("")
+        (tmp_path / "nested.toml").mkdir()
+        
+        discovered = discover_config_files([tmp_path, tmp_path / "missing"])
+        names = {file_type: sorted(p.name for p in files) for file_type, files in discovered.items()}
+        assert names == {
+            "toml": ["settings.toml"],
+            "yaml": ["config.yml", "extra.YAML"],
+            "json": ["config.json"],
+            "env": [".env", ".env.local", "prod.env"],
+        }
+        
+    def test_iter_config_files_is_lazy(self, tmp_path):
+        """Test that files are yielded before later paths are scanned."""
+        (tmp_path / "settings.toml").write_text("")
+        found = iter_config_files([tmp_path, tmp_path / "missing"])
+        assert next(found) == ("toml", tmp_path / "settings.toml")
+        assert list(found) == []
+        
+    def test_discover_config_files_rescans_changed_directories(self, tmp_path):
+        """Test that cached discovery results follow directory changes."""
+        (tmp_path / "settings.toml").write_text("")
+        first = discover_config_files([tmp_path])
+        first["toml"].clear()
+        assert [p.name for p in discover_config_files([tmp_path])["toml"]] == ["settings.toml"]
+        
+        (tmp_path / "settings.toml").unlink()
+        assert discover_config_files([tmp_path])["toml"] == []
+        
+    def test_load_config_file_reuses_parse_until_file_changes(self, tmp_path):
+        """Test that unchanged files are served from the parse cache."""
+        config_file = tmp_path / "settings.toml"
+        config_file.write_text('[app]\nname = "first"\n')
+        
+        first = load_config_file(config_file)
+        first["app"]["name"] = "mutated"
+        assert load_config_file(config_file) == {"app": {"name": "first"}}
+        
+        config_file.write_text('[app]\nname = "second value"\n')
+        assert load_config_file(config_file) == {"app": {"name": "second value"}}
+        
+    def test_load_config_file_cache_is_bounded(self, tmp_path):
+        """Test that the parse cache skips JSON and evicts least recently used files."""
+        from src.config import utils
+        
+        json_file = tmp_path / "settings.json"
+        json_file.write_text(json.dumps({"app": {"name": "cc"}}))
+        toml_files = []
+        for index in range(3):
+            toml_file = tmp_path / f"settings{index}.toml"
+            toml_file.write_text(f'[app]\nindex = {index}\n')
+            toml_files.append(toml_file)
+        
+        with patch.object(utils, "_PARSE_CACHE", type(utils._PARSE_CACHE)()) as cache, \
+                patch.object(utils, "_PARSE_CACHE_SIZE", 2):
+            assert load_config_file(json_file) == {"app": {"name": "cc"}}
+            assert not cache
+            
+            load_config_file(toml_files[0])
+            load_config_file(toml_files[1])
+            load_config_file(toml_files[0])
+            load_config_file(toml_files[2])
+            assert list(cache) == [os.path.abspath(toml_files[0]), os.path.abspath(toml_files[2])]
+        
+    def test_load_config_file_formats(self, tmp_path):
+        """Test that TOML and YAML files parse to the same data."""
+        toml_file = tmp_path / "settings.toml"
+        toml_file.write_text('[app]\nname = "cc"\nproviders = ["aws", "gcp"]\n')
+        yaml_file = tmp_path / "config.yaml"
+        yaml_file.write_text("app:\n  name: cc\n  providers: [aws, gcp]\n")
+        
+        expected = {"app": {"name": "cc", "providers": ["aws", "gcp"]}}
+        assert load_config_file(toml_file) == expected
+        assert load_config_file(yaml_file) == expected
+        
+    def test_load_config_file_missing(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_config_file(tmp_path / "missing.toml")
+
+
+class TestConfigUtils:
+    """Test configuration dictionary helpers."""
+    
+    def test_merge_configs(self):
+        """Test deep merging without modifying the inputs."""
+        base = {"app": {"name": "cc", "debug": False}, "cloud": {"aws": {"region": "us-east-1"}}}
+        local = {"app": {"debug": True}, "cloud": {"aws": {"profile": "dev"}}}
+        cli = {"app": {"log_level": "DEBUG"}, "cloud": {"aws": {"region": "eu-west-1"}}}
+        
+        merged = merge_configs(base, local, cli)
+        assert merged == {
+            "app": {"name": "cc", "debug": True, "log_level": "DEBUG"},
+            "cloud": {"aws": {"region": "eu-west-1", "profile": "dev"}},
+        }
+        assert base == {"app": {"name": "cc", "debug": False}, "cloud": {"aws": {"region": "us-east-1"}}}
+        assert local == {"app": {"debug": True}, "cloud": {"aws": {"profile": "dev"}}}
+        assert merge_configs() == {}
+        
+    def test_export_config_strips_secrets(self, tmp_path):
+        """Test that secrets are left out of exports without touching the live config."""
+        live = {
+            "APP": {"name": "cc"},
+            "CLOUD": {"aws": {"region": "us-east-1", "secret_access_key": "s3cr3t"}},
+        }
+        output_file = tmp_path / "export.json"
+        with patch("src.config.utils.config", live):
+            assert export_config(output_file, file_format="json")
+        
+        exported = json.loads(output_file.read_text())
+        assert exported["CLOUD"]["aws"] == {"region": "us-east-1"}
+        assert live["CLOUD"]["aws"]["secret_access_key"] == "s3cr3t"
+        
+    def test_export_config_strips_secrets_from_environment(self, tmp_path):
+        """Test that secrets set through environment variables are stripped in any case."""
+        settings_file = tmp_path / "settings.toml"
+        settings_file.write_text(
+            '[cloud.aws]\nregion = "us-east-1"\nsecret_access_key = "from-file"\n'
+        )
+        env = {
+            "CLOUDCRAVER_CLOUD__AWS__SECRET_ACCESS_KEY": "from-env",
+            "CLOUDCRAVER_CLOUD__AZURE__CLIENT_SECRET": "azure-secret",
+        }
+        output_file = tmp_path / "export.json"
+        with patch.dict(os.environ, env):
+            live = Dynaconf(
+                settings_files=[str(settings_file)],
+                envvar_prefix="CLOUDCRAVER",
+                merge_enabled=True,
+            )
+            with patch("src.config.utils.config", live):
+                assert export_config(output_file, file_format="json")
+        
+        exported = output_file.read_text()
+        assert "from-env" not in exported
+        assert "from-file" not in exported
+        assert "azure-secret" not in exported
+        assert "us-east-1" in exported
+        assert live.cloud.aws.secret_access_key == "from-env"
+        
+    def test_get_environment_variables(self):
+        """Test that prefixed variables are collected without the prefix."""
+        env = {"CLOUDCRAVER_APP_DEBUG": "true", "CLOUDCRAVERX": "no", "HOME": "/root"}
+        with patch.dict(os.environ, env, clear=True):
+            assert get_environment_variables() == {"app_debug": "true"}
+        
+    def test_normalize_config_key(self):
+        """Test that keys are lower-cased and underscores become dots."""
+        assert normalize_config_key("CLOUD_AWS_Region") == "cloud.aws.region"
+        assert normalize_config_key("app.name") == "app.name"
+        
+    def test_get_config_diff(self):
+        """Test that nested additions, removals and changes are reported."""
+        old = {"app": {"debug": False, "name": "cc"}, "paths": {"logs": "logs"}, "legacy": None}
+        new = {"app": {"debug": True, "name": "cc", "theme": "dark"}, "paths": {"logs": "logs"}}
+        assert get_config_diff(old, new) == {
+            "changed.app.debug": {"old": False, "new": True},
+            "added.app.theme": "dark",
+            "removed.legacy": None,
+        }
+        
+    def test_get_config_diff_non_string_keys(self):
+        """Test that keys YAML parses as integers are reported by their text."""
+        old = {"ports": {80: "http", 443: "https"}}
+        new = {"ports": {80: "web", 8080: "alt"}}
+        assert get_config_diff(old, new) == {
+            "changed.ports.80": {"old": "http", "new": "web"},
+            "removed.ports.443": "https",
+            "added.ports.8080": "alt",
+        }
+
+
+class TestCLIConfigOverrides:
+    """Test mapping of CLI arguments to configuration overrides."""
+    
+    def test_flag_overrides(self):
+        """Test that flags map to their configuration keys."""
+        manager = CLIConfigManager()
+        manager.parse_args(["--debug", "--log-level", "DEBUG", "--no-color", "--no-auto-init"])
+        overrides = manager.get_config_overrides()
+        assert overrides == {
+            "app.debug": True,
+            "app.log_level": "DEBUG",
+            "cli.colored_output": False,
+            "terraform.auto_init": False,
+        }
+        
+    def test_toggle_overrides_last_flag_wins(self):
+        """Test that on/off options apply in either direction."""
+        manager = CLIConfigManager()
+        manager.parse_args(["--auto-save", "--no-auto-save", "--disable-security-scan", "--auto-init"])
+        overrides = manager.get_config_overrides()
+        assert overrides == {
+            "user.preferences.auto_save": False,
+            "terraform.validation.enable_security_scan": False,
+            "terraform.auto_init": True,
+        }
+        
+    def test_provider_dependent_overrides(self):
+        """Test that --region and --profile follow the selected provider."""
+        manager = CLIConfigManager()
+        manager.parse_args(["--provider", "azure", "--region", "West Europe", "--profile", "sub-123"])
+        overrides = manager.get_config_overrides()
+        assert overrides["cloud.default_provider"] == "azure"
+        assert overrides["cloud.default_regions.azure"] == "West Europe"
+        assert overrides["cloud.azure.subscription_id"] == "sub-123"
+        
+    def test_parser_shared_between_instances(self):
+        """Test that the argument parser is only built once."""
+        assert CLIConfigManager().parser is CLIConfigManager().parser
+        
+    def test_help_served_from_cache(self, capsys, tmp_path, monkeypatch):
+        """Test that --help is answered without parsing arguments."""
+        from src.config import cli_config
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        with patch.object(CLIConfigManager, "parse_args") as mock_parse:
+            with pytest.raises(SystemExit) as exc_info:
+                cli_config.parse_cli_args(["--help"])
+        assert exc_info.value.code == 0
+        mock_parse.assert_not_called()
+        assert "usage: cloudcraver" in capsys.readouterr().out
+        
+    def test_help_reused_across_runs(self, capsys, tmp_path, monkeypatch):
+        """Test that help rendered by one run is reused by the next."""
+        from src.config import cli_config
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        with pytest.raises(SystemExit):
+            cli_config.parse_cli_args(["-h"])
+        first_output = capsys.readouterr().out
+        assert (tmp_path / "cloudcraver" / "help.txt").exists()
+        
+        with patch("argparse.ArgumentParser.format_help") as mock_help:
+            with pytest.raises(SystemExit):
+                cli_config.parse_cli_args(["-h"])
+        mock_help.assert_not_called()
+        assert capsys.readouterr().out == first_output
+        assert [p.name for p in (tmp_path / "cloudcraver").iterdir()] == ["help.txt"]
+        
+    def test_help_cache_keyed_on_locale(self, capsys, tmp_path, monkeypatch):
+        """Test that help cached under one locale is not reused under another."""
+        from src.config import cli_config
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setenv("LANG", "en_US.UTF-8")
+        with pytest.raises(SystemExit):
+            cli_config.parse_cli_args(["-h"])
+        
+        monkeypatch.setenv("LANG", "de_DE.UTF-8")
+        with patch("argparse.ArgumentParser.format_help", return_value="hilfe\n") as mock_help:
+            with pytest.raises(SystemExit):
+                cli_config.parse_cli_args(["-h"])
+        mock_help.assert_called_once()
+        assert capsys.readouterr().out.endswith("hilfe\n")
+        
+    def test_validate_args_checks_paths(self, tmp_path):
+        """Test that missing files and non-directories are reported."""
+        config_file = tmp_path / "custom.toml"
+        config_file.write_text("")
+        manager = CLIConfigManager()
+        
+        manager.parse_args(["--config-file", str(config_file), "--config-dir", str(tmp_path)])
+        assert manager.validate_args() == []
+        
+        manager.parse_args(["--config-file", str(tmp_path / "missing.toml"), "--config-dir", str(config_file)])
+        errors = manager.validate_args()
+        assert any("Configuration file does not exist" in error for error in errors)
+        assert any("Configuration directory does not exist" in error for error in errors)
+        
+    def test_no_args_no_overrides(self):
+        """Test that no overrides are produced before parsing."""
+        assert CLIConfigManager().get_config_overrides() == {}
+        
+    def test_apply_overrides_in_single_update(self):
+        """Test that overrides are merged into settings in one call."""
+        manager = CLIConfigManager()
+        manager.parse_args(["--debug", "--theme", "dark"])
+        with patch("src.config.config", create=True) as mock_settings:
+            manager.apply_cli_overrides()
+        mock_settings.update.assert_called_once_with(
+            {"app.debug": True, "user.preferences.theme": "dark"}, merge=True
+        )
+        mock_settings.setenv.assert_not_called()
+
+
 class TestConfigurationIntegration:
     """Test integration between different configuration components."""
     
@@ -0,0 +1,228 @@
+import io
+import json
+import subprocess
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from src import validator
+from src.validator import TerraformValidator
+
+
+def _fake_run_command(outputs, delays=None):
+    # Stand-in for TerraformValidator._run_command keyed on the tool name
+    delays = delays or {}
+
+    def run_command(self, command, cwd=None, raw_stdout=False):
+        time.sleep(delays.get(command[0], 0))
+        stdout = outputs.get(command[0], b"")
+        if not raw_stdout:
+            stdout = stdout.decode()
+        return stdout, ""
+
+    return run_command
+
+
+class TestValidateAll(unittest.TestCase):
+    def test_report_order_is_stable(self):
+        outputs = {
+            "terraform": b"Success!",
+            "tfsec": b'{"results": []}',
+            "checkov": b'[{"summary": {"passed": 1, "failed": 0}, "results": {}}]',
+        }
+        # Finish in the reverse of the expected report order
+        delays = {"terraform": 0.2, "tfsec": 0.1, "checkov": 0}
+        tf_validator = TerraformValidator("/tmp/terraform")
+        with patch.object(TerraformValidator, "_run_command", _fake_run_command(outputs, delays)), \
+                patch.object(validator, "_resolve_tool", return_value=None), \
+                redirect_stdout(io.StringIO()):
+            tf_validator.validate_all()
+
+        self.assertEqual(
+            [entry["tool"] for entry in tf_validator.reports],
+            [
+                "terraform validate",
+                "tfsec",
+                "checkov",
+                "Custom Naming Conventions",
+                "Custom Tagging Standards",
+                "Custom Dependency Validation",
+                "Custom Performance Recommendations",
+            ],
+        )
+
+    def test_add_report_keeps_concurrent_entries(self):
+        tf_validator = TerraformValidator("/tmp/terraform")
+        start = threading.Barrier(8)
+
+        def add_reports(worker):
+            start.wait()
+            for index in range(500):
+                tf_validator._add_report({"tool": f"{worker}-{index}"})
+
+        threads = [threading.Thread(target=add_reports, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(tf_validator.reports), 8 * 500)
+        self.assertEqual(len({entry["tool"] for entry in tf_validator.reports}), 8 * 500)
+
+
+class TestRunCommand(unittest.TestCase):
+    def setUp(self):
+        self.tf_validator = TerraformValidator("/tmp/terraform")
+        resolve_patcher = patch.object(validator, "_resolve_tool", return_value="/usr/bin/tfsec")
+        resolve_patcher.start()
+        self.addCleanup(resolve_patcher.stop)
+
+    def test_raw_stdout_returns_undecoded_bytes(self):
+        completed = subprocess.CompletedProcess(["tfsec"], 0, stdout=b"\xff{}\xfe", stderr=b"warn \xff")
+        with patch("subprocess.run", return_value=completed):
+            stdout, stderr = self.tf_validator._run_command(["tfsec"], raw_stdout=True)
+        self.assertEqual(stdout, b"\xff{}\xfe")
+        self.assertEqual(stderr, "warn \ufffd")
+
+    def test_raw_stdout_from_failed_command(self):
+        error = subprocess.CalledProcessError(1, ["tfsec"], output=b"\x80\x81", stderr=b"")
+        with patch("subprocess.run", side_effect=error):
+            stdout, stderr = self.tf_validator._run_command(["tfsec"], raw_stdout=True)
+        self.assertEqual(stdout, b"\x80\x81")
+        self.assertEqual(stderr, "")
+
+    def test_text_stdout_replaces_invalid_bytes(self):
+        completed = subprocess.CompletedProcess(["tfsec"], 0, stdout=b"ok \xff", stderr=b"")
+        with patch("subprocess.run", return_value=completed):
+            stdout, _ = self.tf_validator._run_command(["tfsec"])
+        self.assertEqual(stdout, "ok \ufffd")
+
+    def test_missing_tool_returns_empty_bytes(self):
+        with patch.object(validator, "_resolve_tool", return_value=None):
+            stdout, stderr = self.tf_validator._run_command(["tfsec"], raw_stdout=True)
+        self.assertEqual(stdout, b"")
+        self.assertIn("Command not found", stderr)
+
+    def test_tfsec_reports_non_utf8_output(self):
+        completed = subprocess.CompletedProcess(["tfsec"], 0, stdout=b"\xff\xfe not json", stderr=b"")
+        with patch("subprocess.run", return_value=completed), redirect_stdout(io.StringIO()):
+            self.tf_validator.run_tfsec()
+        report_entry = self.tf_validator.reports[0]
+        self.assertEqual(report_entry["severity"], "ERROR")
+        self.assertEqual(report_entry["message"], "tfsec output is not valid JSON.")
+        self.assertEqual(report_entry["details"], "\ufffd\ufffd not json")
+
+    def test_tfsec_reports_non_utf8_output_without_orjson(self):
+        completed = subprocess.CompletedProcess(["tfsec"], 0, stdout=b"\xff\xfe not json", stderr=b"")
+        with patch.object(validator, "_json_loads", json.loads), \
+                patch("subprocess.run", return_value=completed), redirect_stdout(io.StringIO()):
+            self.tf_validator.run_tfsec()
+        self.assertEqual(self.tf_validator.reports[0]["severity"], "ERROR")
+
+
+class TestRunTfsec(unittest.TestCase):
+    def run_tfsec(self, results):
+        outputs = {"tfsec": json.dumps({"results": results}).encode()}
+        tf_validator = TerraformValidator("/tmp/terraform")
+        with patch.object(TerraformValidator, "_run_command", _fake_run_command(outputs)), \
+                redirect_stdout(io.StringIO()):
+            tf_validator.run_tfsec()
+        return tf_validator.reports[0]
+
+    def test_reports_most_severe_results(self):
+        results = (
+            [{"rule_id": f"low-{i}", "severity": "LOW"} for i in range(10)]
+            + [{"rule_id": f"unknown-{i}", "severity": "WARNING"} for i in range(5)]
+            + [{"rule_id": f"missing-{i}"} for i in range(5)]
+            + [{"rule_id": f"medium-{i}", "severity": "MEDIUM"} for i in range(10)]
+            + [{"rule_id": f"critical-{i}", "severity": "CRITICAL"} for i in range(5)]
+        )
+        self.assertGreater(len(results), validator._MAX_REPORTED_RESULTS)
+
+        report_entry = self.run_tfsec(results)
+
+        self.assertEqual(report_entry["severity"], "CRITICAL")
+        self.assertEqual(report_entry["message"], "tfsec found 35 issues.")
+        self.assertEqual(report_entry["details"]["results_count"], 35)
+        reported = report_entry["details"]["results"]
+        self.assertEqual(len(reported), validator._MAX_REPORTED_RESULTS)
+        # Most severe first, ties kept in tfsec's order
+        self.assertEqual(
+            [result["rule_id"] for result in reported],
+            [f"critical-{i}" for i in range(5)]
+            + [f"medium-{i}" for i in range(10)]
+            + [f"low-{i}" for i in range(5)],
+        )
+
+    def test_unknown_severities_only(self):
+        results = [{"rule_id": f"unknown-{i}", "severity": "WARNING"} for i in range(25)]
+
+        report_entry = self.run_tfsec(results)
+
+        self.assertEqual(report_entry["severity"], "UNKNOWN")
+        self.assertEqual(len(report_entry["details"]["results"]), validator._MAX_REPORTED_RESULTS)
+        self.assertEqual(report_entry["details"]["results"][0]["rule_id"], "unknown-0")
+
+
+class TestRunCheckov(unittest.TestCase):
+    def run_checkov(self, checkov_output):
+        outputs = {"checkov": json.dumps(checkov_output).encode()}
+        tf_validator = TerraformValidator("/tmp/terraform")
+        with patch.object(TerraformValidator, "_run_command", _fake_run_command(outputs)), \
+                redirect_stdout(io.StringIO()):
+            passed = tf_validator.run_checkov()
+        return passed, tf_validator.reports[0]
+
+    def test_details_keep_summary_and_failed_checks_only(self):
+        summary = {"passed": 40, "failed": 25, "skipped": 1, "parsing_errors": 0}
+        checkov_output = [{
+            "check_type": "terraform",
+            "summary": summary,
+            "results": {
+                "passed_checks": [{"check_id": f"CKV_PASS_{i}"} for i in range(40)],
+                "failed_checks": [{"check_id": f"CKV_FAIL_{i}"} for i in range(25)],
+                "skipped_checks": [{"check_id": "CKV_SKIP_0"}],
+                "parsing_errors": [],
+            },
+        }]
+
+        passed, report_entry = self.run_checkov(checkov_output)
+
+        self.assertFalse(passed)
+        self.assertEqual(report_entry["severity"], "HIGH")
+        self.assertEqual(report_entry["message"], "checkov found 25 failed checks.")
+        self.assertEqual(set(report_entry["details"]), {"summary", "failed_checks"})
+        self.assertEqual(report_entry["details"]["summary"], summary)
+        self.assertEqual(
+            [check["check_id"] for check in report_entry["details"]["failed_checks"]],
+            [f"CKV_FAIL_{i}" for i in range(validator._MAX_REPORTED_RESULTS)],
+        )
+
+    def test_passing_run(self):
+        checkov_output = [{
+            "summary": {"passed": 3, "failed": 0},
+            "results": {"passed_checks": [{"check_id": "CKV_PASS_0"}] * 3},
+        }]
+
+        passed, report_entry = self.run_checkov(checkov_output)
+
+        self.assertTrue(passed)
+        self.assertEqual(report_entry["severity"], "INFO")
+        self.assertEqual(report_entry["message"], "checkov passed 3 checks.")
+        self.assertEqual(report_entry["details"], {"summary": {"passed": 3, "failed": 0}, "failed_checks": []})
+
+
+class TestResolveTool(unittest.TestCase):
+    def test_caches_hits_but_not_misses(self):
+        with patch.dict(validator._TOOL_PATHS, clear=True), \
+                patch("shutil.which", side_effect=[None, "/usr/bin/tfsec"]) as mock_which:
+            self.assertIsNone(validator._resolve_tool("tfsec"))
+            self.assertEqual(validator._resolve_tool("tfsec"), "/usr/bin/tfsec")
+            self.assertEqual(validator._resolve_tool("tfsec"), "/usr/bin/tfsec")
+        self.assertEqual(mock_which.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()